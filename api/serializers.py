@@ -317,10 +317,9 @@ class BookRecommendationListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for book list views."""
 
     added_by_name = serializers.CharField(source="added_by.get_display_name", read_only=True)
-    # Map to annotation names from BookRecommendationViewSet.get_queryset()
-    # Avoids calling model @property which triggers N+1 queries
+    # Stored rating columns on BookRecommendation, refreshed whenever a rating changes
     average_rating = serializers.FloatField(source="avg_rating", read_only=True)
-    rating_count = serializers.IntegerField(source="num_ratings", read_only=True)
+    rating_count = serializers.IntegerField(source="review_count", read_only=True)
 
     class Meta:
         model = BookRecommendation
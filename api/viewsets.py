@@ -5,7 +5,7 @@ Also exposed as MCP tools for AI agent integration.
 """
 
 from django.core.cache import cache
-from django.db.models import Avg, Count, Q
+from django.db.models import Q
 from djangorestframework_mcp.decorators import mcp_viewset
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
@@ -272,9 +272,7 @@ class BookRecommendationViewSet(viewsets.ModelViewSet):
     lookup_field = "slug"
 
     def get_queryset(self):
-        queryset = BookRecommendation.objects.filter(is_published=True, is_approved=True).annotate(
-            avg_rating=Avg("ratings__rating"), num_ratings=Count("ratings")
-        )
+        queryset = BookRecommendation.objects.filter(is_published=True, is_approved=True)
 
         # Search
         search = self.request.query_params.get("search")
@@ -320,7 +318,7 @@ class BookRecommendationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def top_rated(self, request):
         """Get top-rated books (minimum 3 ratings to qualify)."""
-        top = self.get_queryset().filter(num_ratings__gte=3).order_by("-avg_rating")[:10]
+        top = self.get_queryset().filter(review_count__gte=3).order_by("-avg_rating")[:10]
         serializer = BookRecommendationListSerializer(top, many=True)
         return Response(serializer.data)
 
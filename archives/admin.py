@@ -30,8 +30,6 @@ class ArchiveItemInline(admin.StackedInline):
 
 @admin.action(description="✅ Approve selected archives")
 def approve_archives(modeladmin, request, queryset):
-    from django.core.cache import cache
-
     from core.notifications_utils import send_post_approved_notification
     from core.tasks import notify_indexnow
 
@@ -44,8 +42,6 @@ def approve_archives(modeladmin, request, queryset):
         if archive.slug:
             notify_indexnow(f"https://igboarchives.com.ng/archives/{archive.slug}/")
         count += 1
-    cache.delete("all_approved_archive_ids")
-    cache.delete("archive_categories")
     modeladmin.message_user(request, f"{count} archive(s) approved and notifications sent.")
 
 
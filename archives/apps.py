@@ -6,4 +6,8 @@ class ArchivesConfig(AppConfig):
     name = "archives"
 
     def ready(self):
-        pass
+        from django.db.models.signals import post_migrate
+
+        from .search import create_search_index
+
+        post_migrate.connect(create_search_index, sender=self)
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.3 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("archives", "0007_alter_category_slug"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="archive",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["-created_at", "id"],
+                name="arch_approved_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archive",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["category", "-created_at"],
+                name="arch_approved_cat_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.3 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("archives", "0008_archive_approved_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="archive",
+            index=models.Index(
+                condition=models.Q(("is_approved", True)),
+                fields=["author", "-created_at", "id"],
+                name="arch_approved_author_idx",
+            ),
+        ),
+    ]
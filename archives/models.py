@@ -2,12 +2,18 @@ import json
 import logging
 import re
 
+import nh3
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.validators import FileExtensionValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.text import slugify
 
+from core.sanitize import SANITIZER_TRIGGER_CHARS
+
 logger = logging.getLogger(__name__)
 
 from core.validators import (
@@ -19,6 +25,9 @@ from core.validators import (
 
 User = get_user_model()
 
+# Built once at import: nh3.clean() constructs a fresh ammonia sanitizer on every call
+DESCRIPTION_CLEANER = nh3.Cleaner()
+
 
 class Category(models.Model):
     CATEGORY_TYPES = [
@@ -194,6 +203,18 @@ class Archive(models.Model):
             models.Index(fields=["archive_type", "is_approved"], name="arch_type_approved_idx"),
             models.Index(fields=["category", "is_approved"], name="arch_cat_approved_idx"),
             models.Index(fields=["sort_year"], name="arch_sort_year_idx"),
+            # Partial indexes: the public list and prev/next navigation only ever read approved rows
+            models.Index(
+                fields=["-created_at", "id"], condition=models.Q(is_approved=True), name="arch_approved_created_idx"
+            ),
+            models.Index(
+                fields=["category", "-created_at"], condition=models.Q(is_approved=True), name="arch_approved_cat_idx"
+            ),
+            models.Index(
+                fields=["author", "-created_at", "id"],
+                condition=models.Q(is_approved=True),
+                name="arch_approved_author_idx",
+            ),
         ]
 
     def __str__(self):
@@ -201,20 +222,15 @@ class Archive(models.Model):
 
     def _generate_slug(self):
         """Auto-generate a unique slug from title."""
-        import uuid
-
-        base_slug = slugify(self.title)[:200]
-        if not base_slug:
-            base_slug = "archive"
-        slug = base_slug
-        counter = 1
-        while Archive.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-            if counter > 100:
-                slug = f"{base_slug}-{uuid.uuid4().hex[:8]}"
-                break
-        self.slug = slug
+        from core.editorjs_helpers import generate_unique_slug
+
+        base_slug = slugify(self.title)[:200] or "archive"
+        self.slug = generate_unique_slug(base_slug, Archive, exclude_pk=self.pk)
+
+    def _sanitize_description(self):
+        """Sanitize the description with nh3, skipping plain text the cleaner would leave as is."""
+        if not SANITIZER_TRIGGER_CHARS.isdisjoint(self.description):
+            self.description = DESCRIPTION_CLEANER.clean(self.description)
 
     def _link_author(self):
         """Auto-link original_author text to Author FK and vice versa."""
@@ -246,10 +262,20 @@ class Archive(models.Model):
     def save(self, *args, **kwargs):
         # Skip heavy logic when only specific fields are being updated (e.g. from signals)
         update_fields = kwargs.get("update_fields")
-        if update_fields is None:
-            import nh3
-
-            self.description = nh3.clean(self.description)
+        if update_fields is not None:
+            # Partial saves still keep sanitized/derived columns in step with the fields being written
+            update_fields = set(update_fields)
+            if "description" in update_fields:
+                self._sanitize_description()
+            if "original_author" in update_fields or "author" in update_fields:
+                self._link_author()
+                update_fields |= {"original_author", "author"}
+            if update_fields & {"date_created", "circa_date"}:
+                self._calculate_sort_year()
+                update_fields.add("sort_year")
+            kwargs["update_fields"] = update_fields
+        else:
+            self._sanitize_description()
             if not self.slug:
                 self._generate_slug()
             self._link_author()
@@ -364,6 +390,82 @@ class ArchiveItem(models.Model):
         return None
 
 
+def update_parent_archive(archive, first_item=None):
+    """Copy item count, type and media from the first item onto the parent archive.
+
+    Concurrent item writes on the same archive must serialize instead of overwriting
+    each other's header sync. On SQLite that comes from the IMMEDIATE transaction mode
+    in settings: atomic() takes the database write lock up front, and Django drops
+    FOR UPDATE there. select_for_update() only adds a row lock on other backends.
+    Callers that just saved the items can pass ``first_item`` to skip looking it up again.
+    """
+    try:
+        with transaction.atomic():
+            try:
+                archive = Archive.objects.select_for_update().get(pk=archive.pk)
+            except Archive.DoesNotExist:
+                # Parent is being deleted along with its items
+                return
+
+            # 1. Update Count
+            current_count = archive.items.count()
+            archive.item_count = current_count
+
+            # 2. Get the first item (lowest item_number)
+            if first_item is None:
+                first_item = archive.items.order_by("item_number").first()
+
+            if first_item:
+                # Copy metadata from Item 1
+                archive.archive_type = first_item.item_type
+
+                # We only auto-update the parent caption if it's currently empty
+                if not archive.caption:
+                    archive.caption = first_item.caption
+                if not archive.alt_text and first_item.alt_text:
+                    archive.alt_text = first_item.alt_text
+
+                # Reset all media fields on the parent to clean state
+                archive.image = None
+                archive.video = None
+                archive.audio = None
+                archive.document = None
+
+                # Copy the specific file from Item 1 to the Parent
+                if first_item.item_type == "image":
+                    archive.image = first_item.image
+                elif first_item.item_type == "video":
+                    archive.video = first_item.video
+                elif first_item.item_type == "audio":
+                    archive.audio = first_item.audio
+                elif first_item.item_type == "document":
+                    archive.document = first_item.document
+
+                # Save specific fields to avoid recursion
+                archive.save(
+                    update_fields=[
+                        "item_count",
+                        "archive_type",
+                        "image",
+                        "video",
+                        "audio",
+                        "document",
+                        "caption",
+                        "alt_text",
+                    ]
+                )
+
+            else:
+                # If NO items exist (e.g. user deleted the last item)
+                archive.image = None
+                archive.video = None
+                archive.audio = None
+                archive.document = None
+                archive.save(update_fields=["item_count", "image", "video", "audio", "document"])
+    except Exception as e:
+        logger.error(f"Failed to update parent archive {archive.pk}: {e}")
+
+
 class ArchiveNote(models.Model):
     """
     Community Notes (Additional Context) for an archive using Editor.js.
@@ -419,3 +521,35 @@ class ArchiveNoteSuggestion(models.Model):
 
     def __str__(self):
         return f"Suggestion by {self.suggested_by} on {self.note}"
+
+
+# --- Cache Invalidation ---
+
+
+@receiver(post_save, sender=Archive)
+@receiver(post_delete, sender=Archive)
+def invalidate_archive_list(sender, instance, created=False, update_fields=None, **kwargs):
+    """Approvals, edits and deletes of public archives change the list grid and category counts.
+
+    Pending archives never appear in the grid, so saves that neither touch an approved
+    archive nor write is_approved (new submissions, item syncs on pending uploads) skip
+    the invalidation. Full saves of existing rows always invalidate since the previous
+    approval state is unknown.
+    """
+    if not instance.is_approved:
+        if kwargs.get("signal") is post_delete or created:
+            return
+        if update_fields is not None and "is_approved" not in update_fields:
+            return
+
+    from .views import invalidate_archive_list_cache
+
+    invalidate_archive_list_cache()
+    cache.delete("archive_category_counts")
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_archive_categories(sender, instance, **kwargs):
+    """Renamed, added or removed categories must show up in the list filter immediately."""
+    cache.delete("archive_categories")
@@ -0,0 +1,89 @@
+"""
+Full-text search index for archive text lookups.
+
+An SQLite FTS5 table with the trigram tokenizer mirrors the searchable archive
+columns. Trigram MATCH finds any case-insensitive substring of three or more
+characters, so it answers the same question as icontains without scanning rows.
+"""
+
+from django.db import connection, connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_TABLE = "archives_archive_search"
+SEARCH_COLUMNS = ("title", "description", "original_author", "circa_date")
+MIN_SEARCH_LENGTH = 3  # Trigram tokens need at least three characters
+
+_columns = ", ".join(SEARCH_COLUMNS)
+_new_values = ", ".join(f"new.{column}" for column in SEARCH_COLUMNS)
+_old_values = ", ".join(f"old.{column}" for column in SEARCH_COLUMNS)
+
+# External-content table kept in step by triggers. Every statement is idempotent so
+# post_migrate can re-run them, which also restores triggers after Django remakes the table.
+SEARCH_INDEX_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        {_columns},
+        content='archives_archive', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ai AFTER INSERT ON archives_archive BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ad AFTER DELETE ON archives_archive BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {_columns}) VALUES ('delete', old.id, {_old_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_au AFTER UPDATE OF {_columns} ON archives_archive BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {_columns}) VALUES ('delete', old.id, {_old_values});
+        INSERT INTO {SEARCH_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END
+    """,
+]
+
+
+def create_search_index(using="default", **kwargs):
+    """post_migrate handler: create the FTS table and triggers, rebuilding when missing or stale."""
+    db = connections[using]
+    if db.vendor != "sqlite":
+        return
+
+    with db.cursor() as cursor:
+        cursor.execute(f"PRAGMA table_info({SEARCH_TABLE})")
+        indexed = tuple(row[1] for row in cursor.fetchall())
+        rebuild = indexed != SEARCH_COLUMNS
+        if indexed and rebuild:
+            # Column set changed: drop the table and triggers so they are recreated to match
+            cursor.execute(f"DROP TABLE {SEARCH_TABLE}")
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_{suffix}")
+        for statement in SEARCH_INDEX_SQL:
+            cursor.execute(statement)
+        if rebuild:
+            cursor.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+
+
+def filter_by_search_index(queryset, search, columns):
+    """Restrict an Archive queryset to rows where any of ``columns`` contains ``search``.
+
+    Falls back to icontains for terms too short for trigrams and for non-SQLite databases.
+    """
+    if connection.vendor != "sqlite" or len(search) < MIN_SEARCH_LENGTH:
+        matches = Q()
+        for column in columns:
+            matches |= Q(**{f"{column}__icontains": search})
+        return queryset.filter(matches)
+
+    # A quoted phrase is matched literally, so user input cannot inject FTS5 query syntax
+    phrase = '{{{}}} : "{}"'.format(" ".join(columns), search.replace('"', '""'))
+    matches = RawSQL(f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s", [phrase])
+    return queryset.filter(pk__in=matches)
+
+
+def filter_archives_by_search(queryset, search):
+    """Restrict an Archive queryset to rows whose title, description or original author contain ``search``."""
+    return filter_by_search_index(queryset, search, ("title", "description", "original_author"))
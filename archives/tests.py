@@ -7,7 +7,7 @@ from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.test import Client, TestCase
+from django.test import Client, RequestFactory, TestCase
 from django.urls import reverse
 
 from archives.models import Archive, Category
@@ -36,13 +36,50 @@ class CategoryModelTests(TestCase):
         with self.assertRaises(Exception):
             Category.objects.create(name="Test 2", slug="test-slug")
 
+    def test_cached_categories_are_dicts_and_invalidated_on_save(self):
+        """Test the category cache holds plain dicts and is dropped when a category changes."""
+        from django.core.cache import cache
+
+        from archives.views import get_cached_categories
+
+        cache.clear()
+        category = Category.objects.create(name="Masks", slug="masks")
+
+        self.assertEqual(get_cached_categories(), [{"id": category.id, "name": "Masks", "slug": "masks", "count": 0}])
+
+        category.name = "Masquerades"
+        category.save()
+
+        self.assertEqual(get_cached_categories()[0]["name"], "Masquerades")
+
+    def test_cached_category_counts_follow_approvals(self):
+        """Test approving an archive refreshes the counts without rebuilding the category list."""
+        from django.core.cache import cache
+
+        from archives.views import get_cached_categories
+
+        cache.clear()
+        user = User.objects.create_user(username="counter", password="testpass123")
+        category = Category.objects.create(name="Masks", slug="masks")
+        archive = Archive.objects.create(
+            title="Mask", description="A mask", archive_type="image", uploaded_by=user, category=category
+        )
+        self.assertEqual(get_cached_categories()[0]["count"], 0)
+
+        archive.is_approved = True
+        archive.save(update_fields=["is_approved"])
+
+        self.assertIsNotNone(cache.get("archive_categories"))
+        self.assertEqual(get_cached_categories()[0]["count"], 1)
+
 
 class ArchiveModelTests(TestCase):
     """Tests for the Archive model."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(username="testuser", email="test@example.com", password="testpass123")
-        self.category = Category.objects.create(name="Test Category", slug="test-category")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="testuser", email="test@example.com", password="testpass123")
+        cls.category = Category.objects.create(name="Test Category", slug="test-category")
 
     def test_create_archive(self):
         """Test creating an archive."""
@@ -99,6 +136,30 @@ class ArchiveModelTests(TestCase):
         # Without featured image or image file
         self.assertFalse(archive.has_featured_image())
 
+    def test_partial_save_keeps_derived_fields_in_step(self):
+        """Test update_fields saves still recalculate sort_year and sanitize the description."""
+        archive = Archive.objects.create(
+            title="Partial", description="Description", archive_type="image", uploaded_by=self.user
+        )
+
+        archive.circa_date = "c1910"
+        archive.description = "<script>alert(1)</script>Safe text"
+        archive.save(update_fields=["circa_date", "description"])
+        archive.refresh_from_db()
+
+        self.assertEqual(archive.sort_year, 1910)
+        self.assertNotIn("<script>", archive.description)
+
+    def test_plain_text_description_skips_the_sanitizer(self):
+        """Test descriptions without markup or escapable characters are stored without an nh3 pass."""
+        with patch("archives.models.DESCRIPTION_CLEANER") as mock_cleaner:
+            archive = Archive.objects.create(
+                title="Plain", description="Photographed near Awka, 1911.", archive_type="image", uploaded_by=self.user
+            )
+
+        mock_cleaner.clean.assert_not_called()
+        self.assertEqual(archive.description, "Photographed near Awka, 1911.")
+
     def test_archive_ordering(self):
         """Test archives are ordered by created_at descending."""
         archive1 = Archive.objects.create(
@@ -118,19 +179,22 @@ class ArchiveModelTests(TestCase):
 class ArchiveViewTests(TestCase):
     """Tests for archive views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(username="testuser", email="test@example.com", password="testpass123")
-        self.category = Category.objects.create(name="Test Category", slug="test-category")
-        self.archive = Archive.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="testuser", email="test@example.com", password="testpass123")
+        cls.category = Category.objects.create(name="Test Category", slug="test-category")
+        cls.archive = Archive.objects.create(
             title="Test Archive",
             description="A test archive",
             archive_type="image",
-            uploaded_by=self.user,
-            category=self.category,
+            uploaded_by=cls.user,
+            category=cls.category,
             is_approved=True,
         )
 
+    def setUp(self):
+        self.client = Client()
+
     def test_archive_list_view(self):
         """Test archive list page loads."""
         response = self.client.get("/archives/", follow=True)
@@ -173,6 +237,295 @@ class ArchiveViewTests(TestCase):
             archive_titles = [a.title for a in response.context["archives"]]
             self.assertIn("Test Archive", archive_titles)
 
+    def test_archive_detail_pk_redirects_with_one_query(self):
+        """Test numeric detail URLs redirect to the slug URL without loading the archive."""
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("archives:detail_pk", args=[self.archive.pk]))
+
+        expected_url = reverse("archives:detail", args=[self.archive.slug])
+        self.assertRedirects(response, expected_url, status_code=301, fetch_redirect_response=False)
+
+    def test_archive_list_query_count_does_not_grow_with_rows(self):
+        """Test grid cards do not trigger per-row queries for deferred fields or items."""
+        from django.core.cache import cache
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get(reverse("archives:list"))
+
+        for i in range(3):
+            Archive.objects.create(
+                title=f"Extra {i}",
+                description="Extra archive",
+                archive_type="audio",
+                original_author="Northcote Thomas",
+                circa_date="c1910",
+                uploaded_by=self.user,
+                category=self.category,
+                is_approved=True,
+            )
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as grown:
+            self.client.get(reverse("archives:list"))
+
+        self.assertEqual(len(grown), len(baseline))
+
+    def test_archive_cards_load_a_blurb_instead_of_the_description(self):
+        """Test grid cards defer the full description and render a database-truncated blurb."""
+        from archives.views import ARCHIVE_CARD_BLURB_LENGTH, get_archive_card_queryset
+
+        self.archive.description = "word " * 400
+        self.archive.save(update_fields=["description"])
+
+        card = get_archive_card_queryset().get(pk=self.archive.pk)
+
+        self.assertIn("description", card.get_deferred_fields())
+        self.assertEqual(len(card.blurb), ARCHIVE_CARD_BLURB_LENGTH)
+
+    def test_archive_list_grid_is_cached_and_invalidated(self):
+        """Test the grid fragment is served from cache until an archive changes."""
+        from django.core.cache import cache
+
+        cache.clear()
+        first = self.client.get(reverse("archives:list"), HTTP_HX_REQUEST="true")
+        self.assertContains(first, "Test Archive")
+
+        with patch("archives.views.get_archive_list_queryset") as mock_queryset:
+            cached = self.client.get(reverse("archives:list"), HTTP_HX_REQUEST="true")
+        mock_queryset.assert_not_called()
+        self.assertContains(cached, "Test Archive")
+
+        self.archive.title = "Renamed Archive"
+        self.archive.save()
+
+        response = self.client.get(reverse("archives:list"), HTTP_HX_REQUEST="true")
+        self.assertContains(response, "Renamed Archive")
+
+    def test_archive_list_caches_only_browse_pages_under_a_forward_only_version(self):
+        """Test filtered and deep pages skip the grid cache and an evicted version never rewinds."""
+        from django.core.cache import cache
+
+        from archives.views import get_archive_list_cache_key, get_archive_list_version
+
+        factory = RequestFactory()
+        browse_key = get_archive_list_cache_key(factory.get("/archives/"))
+        self.assertEqual(get_archive_list_cache_key(factory.get("/archives/", {"page": "1"})), browse_key)
+        for params in ({"search": "Test"}, {"author": "Jones"}, {"after": "2020-01-01T00:00:00,5"}, {"page": "9"}):
+            self.assertIsNone(get_archive_list_cache_key(factory.get("/archives/", params)))
+
+        version = get_archive_list_version()
+        cache.delete("archive_list_version")  # As if culled from the DatabaseCache
+        self.assertGreater(get_archive_list_version(), version)
+
+    def test_archive_list_keyset_pages_follow_cursor(self):
+        """Test the next link carries an after cursor and the cursor page skips COUNT(*)."""
+        from django.core.cache import cache
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from archives.views import paginate_archive_list
+
+        for i in range(12):
+            Archive.objects.create(
+                title=f"Page Archive {i}",
+                description="Paged archive",
+                archive_type="image",
+                uploaded_by=self.user,
+                is_approved=True,
+            )
+
+        cache.clear()
+        first = self.client.get(reverse("archives:list"), HTTP_HX_REQUEST="true")
+        self.assertContains(first, "after=")
+        self.assertNotContains(first, "Test Archive")  # Oldest row spills onto the next page
+
+        request = first.wsgi_request
+        _, previous_query, next_query = paginate_archive_list(request)
+        self.assertIsNone(previous_query)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"{reverse('archives:list')}?{next_query}", HTTP_HX_REQUEST="true")
+        self.assertContains(response, "Test Archive")
+        archive_counts = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "COUNT(" in query["sql"] and "archives_archive" in query["sql"]
+        ]
+        self.assertEqual(archive_counts, [])
+        self.assertNotContains(response, "after=")
+        self.assertContains(response, '<span class="page-link active">2</span>', html=True)
+        self.assertContains(response, "page=1")  # The cursor page still links back
+
+    def test_archive_list_cursor_pages_link_back_by_reverse_seek(self):
+        """Test deep cursor pages get a before cursor that returns exactly the previous page."""
+        from archives.views import ARCHIVE_LIST_PAGE_SIZE, paginate_archive_list
+
+        for i in range(ARCHIVE_LIST_PAGE_SIZE * 3):
+            Archive.objects.create(
+                title=f"Deep Archive {i}",
+                description="Paged archive",
+                archive_type="image",
+                uploaded_by=self.user,
+                is_approved=True,
+            )
+
+        factory = RequestFactory()
+        page_one, _, next_query = paginate_archive_list(factory.get("/archives/"))
+        page_two, _, next_query = paginate_archive_list(factory.get(f"/archives/?{next_query}"))
+        page_three, previous_query, _ = paginate_archive_list(factory.get(f"/archives/?{next_query}"))
+        self.assertEqual(page_three.number, 3)
+        self.assertIn("before=", previous_query)
+
+        back, previous_query, next_query = paginate_archive_list(factory.get(f"/archives/?{previous_query}"))
+        self.assertEqual(back.number, 2)
+        self.assertEqual(list(back), list(page_two))
+        self.assertIn("page=3", next_query)
+
+        back, _, _ = paginate_archive_list(factory.get(f"/archives/?{previous_query}"))
+        self.assertEqual(list(back), list(page_one))
+
+    def test_archive_list_count_is_cached_until_approvals_change(self):
+        """Test numbered pages reuse the cached total and see newly approved archives."""
+        from django.core.cache import cache
+
+        from archives.views import CachedCountPaginator
+
+        cache.clear()
+        archives = Archive.objects.filter(is_approved=True)
+        self.assertEqual(CachedCountPaginator(archives, 12, "all").count, 1)
+
+        fresh = Archive.objects.create(title="Fresh", description="New", archive_type="image", uploaded_by=self.user)
+        Archive.objects.filter(pk=fresh.pk).update(is_approved=True)  # Bypasses the receivers
+        self.assertEqual(CachedCountPaginator(archives, 12, "all").count, 1)
+        self.assertEqual(CachedCountPaginator(archives, 12).count, 2)  # Unscoped totals are never cached
+
+        fresh.is_approved = True
+        fresh.save(update_fields=["is_approved"])
+        self.assertEqual(CachedCountPaginator(archives, 12, "all").count, 2)
+
+    def test_archive_list_search_uses_substring_index(self):
+        """Test search matches case-insensitive substrings and follows edits and deletes."""
+        from archives.views import get_archive_list_queryset
+
+        bronze = Archive.objects.create(
+            title="Igbo-Ukwu Finds",
+            description="Ancient BRONZE vessels",
+            archive_type="image",
+            original_author="Thurstan Shaw",
+            uploaded_by=self.user,
+            is_approved=True,
+        )
+
+        def search(term):
+            return list(get_archive_list_queryset(RequestFactory().get("/archives/", {"search": term})))
+
+        self.assertEqual(search("ronz"), [bronze])
+        self.assertEqual(search("stan sh"), [bronze])
+        self.assertIn(bronze, search("SH"))  # Short terms fall back to icontains
+
+        bronze.description = "Ancient iron vessels"
+        bronze.save()
+        self.assertEqual(search("bronze"), [])
+        self.assertEqual(search("iron"), [bronze])
+
+        bronze.delete()
+        self.assertEqual(search("iron"), [])
+
+    def test_metadata_suggestions_match_substrings(self):
+        """Test author and date suggestions find mid-value substrings and ignore short queries."""
+        Archive.objects.create(
+            title="Mbari House",
+            description="Mbari shrine",
+            archive_type="image",
+            original_author="Northcote Thomas",
+            circa_date="c1910s",
+            uploaded_by=self.user,
+            is_approved=True,
+        )
+        self.client.force_login(self.user)
+        url = reverse("archives:suggestions")
+
+        self.assertEqual(self.client.get(url, {"q": "191", "field": "date"}).json()["results"], ["c1910s"])
+        self.assertIn("Northcote Thomas", self.client.get(url, {"q": "COTE", "field": "author"}).json()["results"])
+        self.assertEqual(self.client.get(url, {"q": "19", "field": "date"}).json()["results"], [])
+
+    def test_author_suggestions_rank_linked_authors_first(self):
+        """Test linked Author names lead, free-text credits follow, and repeats collapse."""
+        from archives.models import Author
+
+        Author.objects.create(name="Zik Cote")
+        for credit in ("Zik Cote", "Abel Cote", "Abel Cote"):
+            Archive.objects.create(
+                title="Credited",
+                description="Credited",
+                archive_type="image",
+                original_author=credit,
+                uploaded_by=self.user,
+            )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("archives:suggestions"), {"q": "cote", "field": "author"})
+
+        self.assertEqual(response.json()["results"], ["Zik Cote", "Abel Cote"])
+
+    def test_archive_list_fragment_is_publicly_cacheable(self):
+        """Test HTMX grid fragments carry shared-cache headers and both variants vary on HX-Request."""
+        fragment = self.client.get(reverse("archives:list"), HTTP_HX_REQUEST="true")
+        page = self.client.get(reverse("archives:list"))
+
+        self.assertIn("public", fragment["Cache-Control"])
+        self.assertIn("max-age=60", fragment["Cache-Control"])
+        self.assertIn("HX-Request", fragment["Vary"])
+        self.assertIn("HX-Request", page["Vary"])
+        self.assertNotIn("public", page.get("Cache-Control", ""))
+
+    def test_author_detail_pages_by_cursor(self):
+        """Test author pages count every archive and hand off to an after cursor for the next page."""
+        from archives.models import Author
+
+        author = Author.objects.create(name="G. I. Jones")
+        for i in range(13):
+            Archive.objects.create(
+                title=f"Jones Photo {i}",
+                description="Field photograph",
+                archive_type="image",
+                author=author,
+                uploaded_by=self.user,
+                is_approved=True,
+            )
+        url = reverse("archives:author_detail", args=[author.slug])
+
+        first = self.client.get(url)
+        self.assertContains(first, "13 Archives")
+        self.assertNotIn("Jones Photo 0", [archive.title for archive in first.context["archives"]])
+
+        second = self.client.get(f"{url}?{first.context['next_query']}")
+        self.assertContains(second, "13 Archives")
+        self.assertEqual([archive.title for archive in second.context["archives"]], ["Jones Photo 0"])
+        self.assertIsNone(second.context["next_query"])
+        self.assertContains(second, '<span class="page-link active">2</span>', html=True)
+
+        back = self.client.get(f"{url}?{second.context['previous_query']}")
+        self.assertEqual(list(back.context["archives"]), list(first.context["archives"]))
+
+    def test_pending_archive_saves_do_not_invalidate_list_cache(self):
+        """Test submissions and edits of unapproved archives leave the grid cache alone."""
+        from django.core.cache import cache
+
+        cache.set("archive_list_version", 5, None)
+
+        pending = Archive.objects.create(
+            title="Pending", description="Pending", archive_type="image", uploaded_by=self.user
+        )
+        pending.save(update_fields=["title"])
+        pending.delete()
+        self.assertEqual(cache.get("archive_list_version"), 5)
+
+        self.archive.save(update_fields=["is_approved"])
+        self.assertGreater(cache.get("archive_list_version"), 5)
+
     def test_archive_detail_view(self):
         """Test archive detail page loads."""
         response = self.client.get(f"/archives/{self.archive.pk}/", follow=True)
@@ -343,6 +696,24 @@ class ArchiveItemModelTests(TestCase):
         self.assertEqual(items[0], item1)
         self.assertEqual(items[1], item2)
 
+    def test_update_parent_archive_copies_first_item(self):
+        """Test the parent takes its count, type, media and caption from item #1."""
+        from archives.models import ArchiveItem, update_parent_archive
+
+        ArchiveItem.objects.create(archive=self.archive, item_type="audio", item_number=2, audio="second.mp3")
+        first = ArchiveItem.objects.create(
+            archive=self.archive, item_type="video", caption="Opening reel", item_number=1, video="first.mp4"
+        )
+
+        with self.assertNumQueries(5):  # Savepoint pair, locked re-read, count, UPDATE; no first-item lookup
+            update_parent_archive(self.archive, first_item=first)
+
+        self.archive.refresh_from_db()
+        self.assertEqual(self.archive.item_count, 2)
+        self.assertEqual(self.archive.archive_type, "video")
+        self.assertEqual(self.archive.video.name, "first.mp4")
+        self.assertEqual(self.archive.caption, "Opening reel")
+
 
 class ArchiveNoteTests(TestCase):
     """Tests for Community Notes functionality."""
@@ -418,3 +789,69 @@ class ArchiveNoteTests(TestCase):
 
         messages = list(response.context["messages"])
         self.assertTrue(any("has been added" in str(m) for m in messages))
+
+
+class ArchiveNavigationTests(TestCase):
+    """Tests for the combined prev/next/recommendations query on the detail page."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.user = User.objects.create_user(username="recuser", email="rec@example.com", password="testpass123")
+        self.older = Archive.objects.create(
+            title="Older", description="Older archive", archive_type="image", uploaded_by=self.user, is_approved=True
+        )
+        self.current = Archive.objects.create(
+            title="Current", description="Current", archive_type="image", uploaded_by=self.user, is_approved=True
+        )
+        self.newer = Archive.objects.create(
+            title="Newer", description="Newer archive", archive_type="image", uploaded_by=self.user, is_approved=True
+        )
+
+    def test_navigation_uses_single_query(self):
+        """Test prev, next and recommendations come back from one database round trip."""
+        from archives.views import get_archive_navigation, get_recommendation_pool
+
+        get_recommendation_pool()  # Warm the shared pool
+
+        with self.assertNumQueries(2):  # Pool cache read + the UNION ALL
+            previous_archive, next_archive, recommended, similar = get_archive_navigation(self.current, count=9)
+
+        self.assertEqual(previous_archive, self.older)
+        self.assertEqual(next_archive, self.newer)
+        self.assertCountEqual(recommended, [self.older, self.newer])
+        self.assertEqual(similar, [self.newer, self.older])  # Same (empty) category, newest first
+
+    def test_recommendations_exclude_current_and_unapproved(self):
+        """Test sampled recommendations skip the current archive and pending uploads."""
+        from archives.views import get_archive_navigation
+
+        Archive.objects.create(
+            title="Pending", description="Pending", archive_type="image", uploaded_by=self.user, is_approved=False
+        )
+
+        _, _, recommended, _ = get_archive_navigation(self.current, count=9)
+
+        self.assertNotIn(self.current, recommended)
+        self.assertEqual(len(recommended), 2)
+
+    def test_recommendations_respect_count(self):
+        """Test the sample size is capped at the requested count."""
+        from archives.views import get_archive_navigation
+
+        _, _, recommended, _ = get_archive_navigation(self.current, count=1)
+
+        self.assertEqual(len(recommended), 1)
+
+    def test_similar_archives_share_category(self):
+        """Test the similar branch only returns approved archives from the same category."""
+        from archives.views import get_archive_navigation
+
+        category = Category.objects.create(name="Pottery", slug="pottery")
+        Archive.objects.filter(pk__in=[self.current.pk, self.older.pk]).update(category=category)
+        self.current.refresh_from_db()
+
+        _, _, _, similar = get_archive_navigation(self.current)
+
+        self.assertEqual(similar, [self.older])
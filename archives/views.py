@@ -5,86 +5,233 @@ Archive views for browsing and managing cultural archives.
 import json
 import logging
 import random  # Non-cryptographic use for content recommendations
+import time
+from urllib.parse import urlencode
 
 from django.contrib import messages
 from django.contrib.auth import get_user_model  # Added to find staff
 from django.contrib.auth.decorators import login_required
 from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db import transaction
-from django.db.models import Q
-from django.http import Http404, JsonResponse
+from django.db import connection, transaction
+from django.db.models import Count, Max, Prefetch, Q, Value
+from django.db.models.functions import Substr
+from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
 from django.urls import reverse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
 
 from core.editorjs_helpers import generate_unique_slug
 from core.validators import ALLOWED_ARCHIVE_SORTS, get_safe_sort
-from core.views import get_all_approved_archive_ids
 
 from .forms import ArchiveForm, ArchiveItemFormSet
-from .models import Archive, Author, Category
+from .models import Archive, ArchiveItem, Author, Category, update_parent_archive
+from .search import MIN_SEARCH_LENGTH, filter_archives_by_search, filter_by_search_index
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
 
 def get_cached_categories():
-    """Cache categories for 1 hour (Archives only)."""
-    categories = cache.get("archive_categories")
-    if categories is None:
+    """Cache archive categories for 1 hour as plain dicts (cheap to pickle, no model instances).
+
+    Names and approved-archive counts are cached under separate keys: renaming a category
+    drops only the list, and approvals drop only the counts, so neither rebuilds the other.
+    """
+
+    def fetch_categories():
         # STRICT FILTER: Only show categories meant for Archives
-        # Annotate with count for template usage
-        from django.db.models import Count
+        return list(Category.objects.filter(type="archive").values("id", "name", "slug").order_by("name"))
 
-        categories = list(
-            Category.objects.filter(type="archive")
-            .annotate(count=Count("archive", filter=Q(archive__is_approved=True)))
-            .order_by("name")
-        )
-        cache.set("archive_categories", categories, 3600)
-    return categories
+    def fetch_counts():
+        approved = Archive.objects.filter(is_approved=True, category__isnull=False).order_by()
+        return dict(approved.values_list("category_id").annotate(count=Count("id")))
 
+    categories = cache.get_or_set("archive_categories", fetch_categories, 3600)
+    counts = cache.get_or_set("archive_category_counts", fetch_counts, 3600)
+    return [{**category, "count": counts.get(category["id"], 0)} for category in categories]
 
-def get_random_recommendations(exclude_pk, count=9):
-    """Memory-efficient random archive selection."""
-    archive_ids = get_all_approved_archive_ids()
-    available_ids = [aid for aid in archive_ids if aid != exclude_pk]
 
-    if not available_ids:
-        return Archive.objects.none()
+# Columns read by the prev/next navigation, recommended carousel and similar-archives sidebar
+ARCHIVE_NAV_FIELDS = (
+    "id",
+    "title",
+    "slug",
+    "archive_type",
+    "image",
+    "featured_image",
+    "image_url",
+    "video_url",
+    "audio_url",
+    "original_author",
+    "author",
+    "date_created",
+    "circa_date",
+    "created_at",
+)
 
-    sample_size = min(count, len(available_ids))
-    random_ids = random.sample(available_ids, sample_size)
 
-    return Archive.objects.filter(pk__in=random_ids).select_related("uploaded_by", "category")
+RECOMMENDATION_POOL_SIZE = 100
+RECOMMENDATION_POOL_TIMEOUT = 300
 
 
-def archive_list(request):
-    """List all approved archives with filtering and pagination."""
-    # REMOVED: prefetch_related('tags')
-    archives = (
-        Archive.objects.filter(is_approved=True)
-        .select_related("uploaded_by", "category", "author")
-        .only(
-            "id",
-            "title",
-            "archive_type",
-            "image",
-            "featured_image",
-            "alt_text",
-            "description",
-            "created_at",
-            "uploaded_by_id",
-            "category_id",
-            "author_id",
-            "uploaded_by__full_name",
-            "uploaded_by__username",
-            "category__name",
-            "category__slug",
-            "sort_year",
+def get_recommendation_pool():
+    """A shared pool of random approved archive IDs, reshuffled every 5 minutes.
+
+    One cache entry serves every detail page, so the ORDER BY RANDOM() scan runs once
+    per refresh instead of once per request.
+    """
+
+    def fetch_pool():
+        shuffled = Archive.objects.filter(is_approved=True).order_by("?")
+        return tuple(shuffled.values_list("id", flat=True)[:RECOMMENDATION_POOL_SIZE])
+
+    return cache.get_or_set("archive_recommendation_pool", fetch_pool, RECOMMENDATION_POOL_TIMEOUT)
+
+
+def get_archive_navigation(archive, count=9, similar_count=5):
+    """Previous/next neighbours, random recommendations and same-category archives in one UNION ALL round trip.
+
+    Returns a (previous, next, recommended, similar) tuple. Each branch is wrapped in its
+    own subquery so SQLite accepts the per-branch ORDER BY/LIMIT. Recommendations are
+    sampled locally from the cached pool and fetched by primary key in the same query.
+    """
+    # Draw one spare and drop the current archive if it was picked, instead of copying the pool
+    pool = get_recommendation_pool()
+    random_ids = random.sample(pool, min(count + 1, len(pool)))
+    random_ids = [aid for aid in random_ids if aid != archive.pk][:count]
+
+    qn = connection.ops.quote_name
+    table = qn(Archive._meta.db_table)
+    columns = ", ".join(qn(Archive._meta.get_field(name).column) for name in ARCHIVE_NAV_FIELDS)
+    created_at = connection.ops.adapt_datetimefield_value(archive.created_at)
+    if archive.category_id is None:
+        category_match, category_params = "category_id IS NULL", []
+    else:
+        category_match, category_params = "category_id = %s", [archive.category_id]
+
+    sql = f"""
+        SELECT * FROM (
+            SELECT 'previous' AS kind, {columns} FROM {table}
+            WHERE is_approved = %s AND created_at < %s ORDER BY created_at DESC LIMIT 1
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'next' AS kind, {columns} FROM {table}
+            WHERE is_approved = %s AND created_at > %s ORDER BY created_at ASC LIMIT 1
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'similar' AS kind, {columns} FROM {table}
+            WHERE is_approved = %s AND {category_match} AND id <> %s ORDER BY created_at DESC LIMIT %s
         )
+    """
+    params = [True, created_at, True, created_at, True, *category_params, archive.pk, similar_count]
+    if random_ids:
+        placeholders = ", ".join(["%s"] * len(random_ids))
+        sql += f"""
+        UNION ALL
+        SELECT 'recommended' AS kind, {columns} FROM {table}
+        WHERE is_approved = %s AND id IN ({placeholders})
+        """
+        params += [True, *random_ids]
+
+    previous_archive = next_archive = None
+    recommended = []
+    similar = []
+    for row in Archive.objects.raw(sql, params):
+        if row.kind == "previous":
+            previous_archive = row
+        elif row.kind == "next":
+            next_archive = row
+        elif row.kind == "similar":
+            similar.append(row)
+        else:
+            recommended.append(row)
+
+    # Keep the sampled order rather than whatever order the IN lookup returned
+    recommended.sort(key=lambda row: random_ids.index(row.pk))
+    return previous_archive, next_archive, recommended, similar
+
+
+# Columns read by archives/partials/archive_grid_item.html. A field missing here is
+# deferred, and every deferred access in the template costs one SELECT per card.
+ARCHIVE_CARD_FIELDS = (
+    "id",
+    "title",
+    "slug",
+    "archive_type",
+    "image",
+    "featured_image",
+    "alt_text",
+    "original_author",
+    "date_created",
+    "circa_date",
+    "created_at",
+    "sort_year",
+    "category_id",
+    "author_id",
+    "category__name",
+    "category__slug",
+    "author__name",
+)
+
+# The card shows 40 words of the description; the full body only loads on the detail page
+ARCHIVE_CARD_BLURB_LENGTH = 500
+
+
+def get_archive_card_queryset():
+    """Archives loaded with exactly what a grid card renders, items included for the media fallback."""
+    return (
+        Archive.objects.select_related("category", "author")
+        .prefetch_related(
+            Prefetch("items", queryset=ArchiveItem.objects.only("id", "archive_id", "item_number", "item_type"))
+        )
+        .only(*ARCHIVE_CARD_FIELDS)
+        .annotate(blurb=Substr("description", 1, ARCHIVE_CARD_BLURB_LENGTH))
     )
 
+
+ARCHIVE_LIST_CACHE_TIMEOUT = 300
+ARCHIVE_LIST_CACHED_PAGES = 3
+ARCHIVE_LIST_FRAGMENT_MAX_AGE = 60
+ARCHIVE_LIST_PAGE_SIZE = 12
+ARCHIVE_LIST_FILTER_PARAMS = ("category", "author", "date", "search", "type")
+
+
+def get_archive_list_version():
+    """Current list cache version, seeded from the clock so an evicted key can never rewind to an old one."""
+    return cache.get_or_set("archive_list_version", time.time_ns, None)
+
+
+def get_archive_list_cache_key(request):
+    """Grid fragment cache key for the unfiltered browse pages, or None if the request is not cached.
+
+    Filtered listings and cursor pages render uncached: keying on arbitrary query strings
+    would fill the culled DatabaseCache. What remains is bounded by the allowed sorts
+    times ARCHIVE_LIST_CACHED_PAGES.
+    """
+    if any(request.GET.get(key) for key in (*ARCHIVE_LIST_FILTER_PARAMS, "after", "before")):
+        return None
+    page = request.GET.get("page") or "1"
+    if not page.isdigit() or not 1 <= int(page) <= ARCHIVE_LIST_CACHED_PAGES:
+        return None
+    sort = get_safe_sort(request.GET.get("sort", "-created_at"), ALLOWED_ARCHIVE_SORTS)
+    return f"archive_list_grid_{get_archive_list_version()}_{sort}_{int(page)}"
+
+
+def invalidate_archive_list_cache():
+    """Drop every cached grid fragment at once by moving the key version forward."""
+    cache.set("archive_list_version", time.time_ns(), None)
+
+
+def get_archive_list_queryset(request):
+    """Approved archives filtered and sorted by the list page query params."""
+    archives = get_archive_card_queryset().filter(is_approved=True)
+
     if category := request.GET.get("category"):
         if category.isdigit():
             archives = archives.filter(category__id=category)
@@ -102,42 +249,182 @@ def archive_list(request):
         archives = archives.filter(circa_date__icontains=circa_date)
 
     if search := request.GET.get("search"):
-        archives = archives.filter(
-            Q(title__icontains=search) | Q(description__icontains=search) | Q(original_author__icontains=search)
-        )
+        archives = filter_archives_by_search(archives, search)
 
     if archive_type := request.GET.get("type"):
         archives = archives.filter(archive_type=archive_type)
 
     sort = get_safe_sort(request.GET.get("sort", "-created_at"), ALLOWED_ARCHIVE_SORTS)
-    archives = archives.order_by(sort)
+    # The id tie-break keeps pages stable and gives the keyset cursor a unique position
+    archives = archives.order_by(sort, "-id")
 
-    paginator = Paginator(archives, 12)
-    archives_page = paginator.get_page(request.GET.get("page"))
+    return archives
 
-    context = {
-        "archives": archives_page,
-        "categories": get_cached_categories(),
-    }
+
+def get_cached_archive_count(archives, scope=None):
+    """COUNT(*) for an archive listing, cached under ``scope`` until the list version moves on.
+
+    Callers pass a scope only for bounded listings (the unfiltered list, one author's
+    archives); ad-hoc filter combinations count directly so they never add cache keys.
+    """
+    if scope is None:
+        return archives.count()
+    key = f"archive_list_count_{get_archive_list_version()}_{scope}"
+    return cache.get_or_set(key, archives.count, ARCHIVE_LIST_CACHE_TIMEOUT)
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that reuses a cached total for ``count_scope`` instead of counting on every numbered page."""
+
+    def __init__(self, object_list, per_page, count_scope=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_scope = count_scope
+
+    @cached_property
+    def count(self):
+        return get_cached_archive_count(self.object_list, self.count_scope)
+
+
+class KeysetPage(list):
+    """One cursor page of archives, carrying the page number its link was given."""
+
+    def __init__(self, rows, number):
+        super().__init__(rows)
+        self.number = number
+
+
+def parse_archive_cursor(value):
+    """Split an ``after``/``before`` cursor of the form ``<created_at ISO>,<id>``; None if malformed."""
+    created_at, _, pk = (value or "").rpartition(",")
+    try:
+        created_at = parse_datetime(created_at)
+    except ValueError:
+        return None
+    if created_at is None or not pk.isdigit():
+        return None
+    return created_at, int(pk)
+
+
+def format_archive_cursor(archive):
+    """Cursor string for ``archive``'s position in the newest-first order."""
+    return f"{archive.created_at.isoformat()},{archive.pk}"
+
+
+def paginate_archives(request, archives, keyset=True, keep_params=(), count_scope=None):
+    """Return a page of ``archives`` and the query strings for its keyset previous/next links.
+
+    Newest-first listings (``keyset``) page by cursor: ``after`` seeks forward from the
+    last row shown and ``before`` seeks back from the first, each on (created_at, id)
+    with one sentinel row, so no COUNT(*) and no OFFSET scan. Cursor links also carry
+    ``page`` so the page number survives. Numbered pages and the other sorts keep using
+    Paginator. ``keep_params`` are the filter params carried over into the links, and
+    ``count_scope`` names the cached total (see get_cached_archive_count).
+    """
+    if not keyset:
+        archives_page = CachedCountPaginator(archives, ARCHIVE_LIST_PAGE_SIZE, count_scope).get_page(
+            request.GET.get("page")
+        )
+        return archives_page, None, None
+
+    after = parse_archive_cursor(request.GET.get("after"))
+    before = None if after else parse_archive_cursor(request.GET.get("before"))
+    requested = request.GET.get("page", "")
+
+    if after or before:
+        number = max(int(requested), 2) if requested.isdigit() else 2
+        created_at, pk = after or before
+        if after:
+            seek = Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+            rows = list(archives.filter(seek)[: ARCHIVE_LIST_PAGE_SIZE + 1])
+            has_next = len(rows) > ARCHIVE_LIST_PAGE_SIZE
+            rows = rows[:ARCHIVE_LIST_PAGE_SIZE]
+        else:
+            # Walk back oldest-first from the cursor, then flip the rows to newest-first
+            seek = Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk)
+            rows = list(archives.filter(seek).reverse()[: ARCHIVE_LIST_PAGE_SIZE + 1])
+            if len(rows) <= ARCHIVE_LIST_PAGE_SIZE:
+                number = 1  # Nothing newer is left, so this is the first page
+            rows = rows[:ARCHIVE_LIST_PAGE_SIZE][::-1]
+            has_next = True
+        archives_page = KeysetPage(rows, number)
+    else:
+        archives_page = CachedCountPaginator(archives, ARCHIVE_LIST_PAGE_SIZE, count_scope).get_page(requested or None)
+        has_next = archives_page.has_next()
+
+    params = [(key, request.GET[key]) for key in keep_params if request.GET.get(key)]
+    number = archives_page.number
+    previous_query = next_query = None
+    if number == 2:
+        previous_query = urlencode([*params, ("page", 1)])
+    elif number > 2 and archives_page:
+        previous_query = urlencode([*params, ("before", format_archive_cursor(archives_page[0])), ("page", number - 1)])
+    if has_next and archives_page:
+        next_query = urlencode([*params, ("after", format_archive_cursor(archives_page[-1])), ("page", number + 1)])
+
+    return archives_page, previous_query, next_query
+
+
+def paginate_archive_list(request):
+    """Return the list grid page and its keyset previous/next links; only the default sort is keyset-safe."""
+    keyset = get_safe_sort(request.GET.get("sort", "-created_at"), ALLOWED_ARCHIVE_SORTS) == "-created_at"
+    # Sort never changes the total, so every unfiltered listing shares one cached count
+    count_scope = None if any(request.GET.get(key) for key in ARCHIVE_LIST_FILTER_PARAMS) else "all"
+    return paginate_archives(
+        request,
+        get_archive_list_queryset(request),
+        keyset=keyset,
+        keep_params=ARCHIVE_LIST_FILTER_PARAMS,
+        count_scope=count_scope,
+    )
+
+
+def archive_list(request):
+    """List all approved archives with filtering and pagination."""
+    # The browse grid is the same for every visitor, so it is cached as rendered HTML;
+    # the surrounding page still renders per request (messages, auth header).
+    cache_key = get_archive_list_cache_key(request)
+    archive_grid = cache.get(cache_key) if cache_key else None
+
+    if archive_grid is None:
+        archives_page, previous_query, next_query = paginate_archive_list(request)
+        archive_grid = render_to_string(
+            "archives/partials/archive_grid.html",
+            {"archives": archives_page, "previous_query": previous_query, "next_query": next_query},
+            request=request,
+        )
+        if cache_key:
+            cache.set(cache_key, archive_grid, ARCHIVE_LIST_CACHE_TIMEOUT)
 
     if request.htmx:
-        return render(request, "archives/partials/archive_grid.html", context)
+        # The fragment is identical for every visitor, so browsers and shared caches may reuse it briefly
+        response = HttpResponse(archive_grid)
+        patch_cache_control(response, public=True, max_age=ARCHIVE_LIST_FRAGMENT_MAX_AGE)
+    else:
+        context = {
+            "archive_grid": archive_grid,
+            "categories": get_cached_categories(),
+        }
+        response = render(request, "archives/list.html", context)
 
-    return render(request, "archives/list.html", context)
+    # Fragment and full page share a URL; caches must not serve one for the other
+    patch_vary_headers(response, ("HX-Request",))
+    return response
 
 
 def archive_detail(request, pk=None, slug=None):
     """Display a single archive with recommendations."""
+    # Items come back sorted from the prefetch, so the template reuses it without another query
+    detail_queryset = Archive.objects.select_related("uploaded_by", "category", "author").prefetch_related(
+        Prefetch("items", queryset=ArchiveItem.objects.order_by("item_number"))
+    )
     if slug:
-        archive = get_object_or_404(
-            Archive.objects.select_related("uploaded_by", "category", "author").prefetch_related("items"), slug=slug
-        )
+        archive = get_object_or_404(detail_queryset, slug=slug)
     elif pk:
-        archive = get_object_or_404(
-            Archive.objects.select_related("uploaded_by", "category", "author").prefetch_related("items"), pk=pk
-        )
-        if archive.slug:
-            return redirect("archives:detail", slug=archive.slug, permanent=True)
+        # Numeric links only redirect to the slug URL, so look that up before loading relations
+        archive_slug = Archive.objects.filter(pk=pk).values_list("slug", flat=True).first()
+        if archive_slug:
+            return redirect("archives:detail", slug=archive_slug, permanent=True)
+        archive = get_object_or_404(detail_queryset, pk=pk)
     else:
         raise Http404("Archive not found")
 
@@ -147,29 +434,9 @@ def archive_detail(request, pk=None, slug=None):
         else:
             raise Http404("Archive not found")
 
-    similar_archives = (
-        Archive.objects.filter(is_approved=True, category=archive.category)
-        .exclude(pk=archive.pk)
-        .select_related("uploaded_by", "author")[:5]
-    )
+    previous_archive, next_archive, recommended, similar_archives = get_archive_navigation(archive, count=9)
 
-    previous_archive = (
-        Archive.objects.filter(is_approved=True, created_at__lt=archive.created_at)
-        .order_by("-created_at")
-        .only("id", "title", "slug")
-        .first()
-    )
-
-    next_archive = (
-        Archive.objects.filter(is_approved=True, created_at__gt=archive.created_at)
-        .order_by("created_at")
-        .only("id", "title", "slug")
-        .first()
-    )
-
-    recommended = get_random_recommendations(archive.pk, count=9)
-
-    archive_items = archive.items.all().order_by("item_number")
+    archive_items = archive.items.all()
 
     ai_correlations = cache.get(f"archive_explore_further_{archive.id}")
 
@@ -222,14 +489,11 @@ def archive_detail(request, pk=None, slug=None):
 def author_detail(request, slug):
     author = get_object_or_404(Author, slug=slug)
 
-    archives_list = (
-        Archive.objects.filter(is_approved=True, author=author)
-        .select_related("category", "uploaded_by")
-        .order_by("-created_at")
-    )
-
-    paginator = Paginator(archives_list, 12)
-    page_obj = paginator.get_page(request.GET.get("page"))
+    archives_list = get_archive_card_queryset().filter(is_approved=True, author=author).order_by("-created_at", "-id")
+    count_scope = f"author_{author.pk}"
+    page_obj, previous_query, next_query = paginate_archives(request, archives_list, count_scope=count_scope)
+    # Shares the cached total the Paginator read on numbered pages, so the header costs no extra COUNT
+    archive_count = get_cached_archive_count(archives_list, count_scope)
 
     from books.models import BookRecommendation
     from lore.models import LorePost
@@ -253,6 +517,9 @@ def author_detail(request, slug):
     context = {
         "author": author,
         "archives": page_obj,
+        "previous_query": previous_query,
+        "next_query": next_query,
+        "archive_count": archive_count,
         "lore_posts": lore_posts,
         "recommended_books": recommended_books,
         "desc_form": desc_form,
@@ -265,24 +532,30 @@ def metadata_suggestions(request):
     """Suggestions for autocomplete (Authors, Dates)."""
     query = request.GET.get("q", "")
     field = request.GET.get("field", "author")
-    results = []
-
-    if len(query) > 1:
-        if field == "author":
-            results = list(Author.objects.filter(name__icontains=query).values_list("name", flat=True)[:10])
 
-            if len(results) < 5:
-                text_results = (
-                    Archive.objects.filter(original_author__icontains=query)
-                    .values_list("original_author", flat=True)
-                    .distinct()[:5]
-                )
-                results = list(set(results + list(text_results)))[:10]
+    if len(query) < MIN_SEARCH_LENGTH or field not in ("author", "date"):
+        return JsonResponse({"results": []})
 
-        elif field == "date":
-            results = list(
-                Archive.objects.filter(circa_date__icontains=query).values_list("circa_date", flat=True).distinct()[:10]
-            )
+    if field == "author":
+        # Linked authors and free-text credits in one UNION round trip, ranked so linked authors come first
+        linked = (
+            Author.objects.filter(name__icontains=query).annotate(rank=Value(0)).values_list("name", "rank").order_by()
+        )
+        credited = (
+            filter_by_search_index(Archive.objects.exclude(original_author=""), query, ("original_author",))
+            .annotate(rank=Value(1))
+            .values_list("original_author", "rank")
+            .order_by()
+        )
+        rows = linked.union(credited).order_by("rank", "name")[:20]
+        # A credit that spells a linked author's name differs only in rank, so drop the repeat
+        results = list(dict.fromkeys(name for name, _ in rows))[:10]
+    else:
+        results = list(
+            filter_by_search_index(Archive.objects.all(), query, ("circa_date",))
+            .values_list("circa_date", flat=True)
+            .distinct()[:10]
+        )
 
     return JsonResponse({"results": results})
 
@@ -319,9 +592,11 @@ def archive_create(request):
                 for i, item in enumerate(items):
                     item.archive = archive
                     item.item_number = i + 1
-                    item.save()
+                # One multi-row INSERT; FileField.pre_save still uploads each file to storage
+                ArchiveItem.objects.bulk_create(items)
 
-                # Signals handle sync_parent_archive_with_first_item automatically
+                # Copy type and media from item #1 onto the parent; it was just saved, so pass it in
+                update_parent_archive(archive, first_item=items[0])
 
                 # Bell Notification
                 try:
@@ -383,32 +658,48 @@ def archive_edit(request, pk=None, slug=None):
             with transaction.atomic():
                 archive = form.save(commit=False)
 
+                # Only write the columns the user actually changed (plus what derives from them)
+                update_fields = {name for name in form.changed_data if name in form._meta.fields}
+                if "original_author" in update_fields:
+                    update_fields.add("author")
+
                 old_title = form.initial.get("title", "")
                 if archive.title != old_title or not archive.slug:
                     archive.slug = generate_unique_slug(archive.title, Archive, exclude_pk=archive.pk)
+                    update_fields.add("slug")
 
-                archive.save()
+                if update_fields:
+                    archive.save(update_fields=update_fields | {"updated_at"})
 
                 items = formset.save(commit=False)
 
                 for obj in formset.deleted_objects:
                     obj.delete()
 
-                for i, item in enumerate(items):
+                # Read the current highest number once, and only if a new item needs one
+                max_num = None
+                new_items = []
+                for item in items:
                     item.archive = archive
                     if not item.item_number:
-                        from django.db.models import Max
-
-                        max_num = archive.items.aggregate(Max("item_number"))["item_number__max"] or 0
-                        item.item_number = max_num + 1
-                    item.save()
+                        if max_num is None:
+                            max_num = archive.items.aggregate(Max("item_number"))["item_number__max"] or 0
+                        max_num += 1
+                        item.item_number = max_num
+                    if item._state.adding:
+                        new_items.append(item)
+                    else:
+                        item.save()
+                # Added rows go in as one multi-row INSERT, as in archive_create
+                ArchiveItem.objects.bulk_create(new_items, batch_size=100)
+
+                if items or formset.deleted_objects:
+                    update_parent_archive(archive)
 
                 if archive.is_approved:
                     # Reset approval if edited
                     archive.is_approved = False
                     archive.save(update_fields=["is_approved"])
-                    cache.delete("all_approved_archive_ids")
-                    cache.delete("archive_categories")
 
                     try:
                         from core.notifications_utils import send_admin_notification
@@ -464,7 +755,6 @@ def archive_delete(request, pk=None, slug=None):
     if request.method == "POST":
         archive_title = archive.title
         archive.delete()
-        cache.delete("all_approved_archive_ids")
         messages.success(request, f'Archive "{archive_title}" has been deleted.')
         return redirect("users:dashboard")
 
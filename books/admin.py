@@ -1,15 +1,133 @@
 from django.contrib import admin
+from django.core.cache import cache
 from django.utils.safestring import mark_safe
 
 try:
     import nh3
 except ImportError:
     nh3 = None
+from core.sanitize import SANITIZER_TRIGGER_CHARS
+
 from .models import BookRecommendation, UserBookRating
 
 # Allowed tags for admin preview
 ADMIN_PREVIEW_ALLOWED_TAGS = {"b", "i", "u", "strong", "em", "br"}
 
+# Built once at import; nh3.clean(tags=...) would construct a new cleaner for every block
+ADMIN_PREVIEW_CLEANER = nh3.Cleaner(tags=ADMIN_PREVIEW_ALLOWED_TAGS) if nh3 else None
+
+# Bounds on what one preview renders, so a hostile content_json cannot stall the change page
+PREVIEW_MAX_BLOCKS = 20
+PREVIEW_MAX_LIST_ITEMS = 50
+PREVIEW_MAX_TEXT_LENGTH = 2000  # Characters per text value, cut before cleaning so tags stay balanced
+PREVIEW_MAX_HTML_LENGTH = 65536
+
+# Preview markup, filled with %-formatting; the inline styles keep the preview readable in the admin
+PREVIEW_HEADER_HTML = '<h%d style="margin:0.5em 0">%s</h%d>'
+PREVIEW_PARAGRAPH_HTML = '<p style="margin:0.5em 0">%s</p>'
+PREVIEW_LIST_HTML = '<%s style="margin:0.5em 0;padding-left:1.5em">%s</%s>'
+PREVIEW_LIST_ITEM_HTML = "<li>%s</li>"
+PREVIEW_QUOTE_HTML = (
+    '<blockquote style="margin:1em 0;padding:0.5em 1em;border-left:3px solid #ddd;background:#f9f9f9">%s</blockquote>'
+)
+PREVIEW_DELIMITER_HTML = '<hr style="margin:1em 0">'
+PREVIEW_MORE_BLOCKS_HTML = '<p style="color:#888"><em>... and %d more blocks</em></p>'
+PREVIEW_WRAPPER_HTML = (
+    '<div style="max-width:700px;padding:1rem;background:#fafafa;border-radius:8px;border:1px solid #e0e0e0">%s</div>'
+)
+
+# Columns the approve/reject notifications read (title, URL, rejection reason, recipient)
+NOTIFICATION_FIELDS = ("id", "title", "slug", "rejection_reason", "added_by")
+
+
+def _clean_preview_text(text):
+    if not text or not isinstance(text, str):
+        return ""
+    text = text[:PREVIEW_MAX_TEXT_LENGTH]
+    # Most Editor.js text is prose with no markup, which the cleaner would return unchanged
+    if SANITIZER_TRIGGER_CHARS.isdisjoint(text):
+        return text
+    return ADMIN_PREVIEW_CLEANER.clean(text)
+
+
+def _render_header(data):
+    level = min(max(int(data.get("level", 2)), 1), 6)
+    return PREVIEW_HEADER_HTML % (level, _clean_preview_text(data.get("text", "")), level)
+
+
+def _render_paragraph(data):
+    return PREVIEW_PARAGRAPH_HTML % _clean_preview_text(data.get("text", ""))
+
+
+def _render_list(data):
+    tag = "ol" if data.get("style", "unordered") == "ordered" else "ul"
+    items_html_parts = []
+    for item in data.get("items", [])[:PREVIEW_MAX_LIST_ITEMS]:
+        # Handle nested list items (dicts with 'content' key)
+        if isinstance(item, dict):
+            text = item.get("content", "")
+        elif isinstance(item, str):
+            text = item
+        else:
+            continue
+        items_html_parts.append(PREVIEW_LIST_ITEM_HTML % _clean_preview_text(text))
+    return PREVIEW_LIST_HTML % (tag, "".join(items_html_parts), tag)
+
+
+def _render_quote(data):
+    return PREVIEW_QUOTE_HTML % _clean_preview_text(data.get("text", ""))
+
+
+def _render_delimiter(data):
+    return PREVIEW_DELIMITER_HTML
+
+
+# Editor.js block type -> HTML renderer; unknown block types are left out of the preview
+PREVIEW_RENDERERS = {
+    "header": _render_header,
+    "paragraph": _render_paragraph,
+    "list": _render_list,
+    "quote": _render_quote,
+    "delimiter": _render_delimiter,
+}
+
+
+def render_content_preview(content_json):
+    """Render EditorJS content as sanitized HTML for the admin preview; the caller marks it safe."""
+    if not content_json or not isinstance(content_json, dict):
+        return "No content"
+
+    if nh3 is None:
+        from django.utils.html import strip_tags
+
+        blocks = content_json.get("blocks", [])
+        text_parts = [strip_tags(b.get("data", {}).get("text", "")) for b in blocks[:5]]
+        return f"<p>{'</p><p>'.join(text_parts)}</p>" if text_parts else "No content"
+
+    blocks = content_json.get("blocks", [])
+    if not blocks or not isinstance(blocks, list):
+        return "No content blocks"
+
+    html_parts = []
+    html_length = rendered = 0
+    try:
+        for block in blocks[:PREVIEW_MAX_BLOCKS]:
+            if html_length > PREVIEW_MAX_HTML_LENGTH:
+                break
+            rendered += 1
+            render = PREVIEW_RENDERERS.get(block.get("type", "paragraph"))
+            if render is not None:
+                html_parts.append(render(block.get("data", {})))
+                html_length += len(html_parts[-1])
+    except (AttributeError, TypeError, ValueError):
+        # Malformed block data (wrong JSON shapes, non-numeric header levels)
+        return "Preview unavailable"
+
+    if len(blocks) > rendered:
+        html_parts.append(PREVIEW_MORE_BLOCKS_HTML % (len(blocks) - rendered))
+
+    return PREVIEW_WRAPPER_HTML % "".join(html_parts)
+
 
 class UserBookRatingInline(admin.TabularInline):
     """
@@ -23,10 +141,24 @@ class UserBookRatingInline(admin.TabularInline):
     can_delete = True
     show_change_link = True
 
+    def get_queryset(self, request):
+        # Each row's label (UserBookRating.__str__) reads the user and the book
+        return super().get_queryset(request).select_related("user", "book")
+
 
 @admin.register(BookRecommendation)
 class BookRecommendationAdmin(admin.ModelAdmin):
-    list_display = ["book_title", "author", "added_by", "is_published", "is_approved", "created_at"]
+    list_display = [
+        "book_title",
+        "author",
+        "added_by",
+        "average_rating_display",
+        "rating_count_display",
+        "is_published",
+        "is_approved",
+        "created_at",
+    ]
+    list_select_related = ["added_by"]
     list_filter = ["is_published", "is_approved", "created_at"]
     search_fields = ["book_title", "author", "title", "added_by__username", "added_by__email"]
     prepopulated_fields = {"slug": ("title",)}
@@ -58,53 +190,55 @@ class BookRecommendationAdmin(admin.ModelAdmin):
         ),
     )
 
+    @admin.display(description="Avg rating", ordering="avg_rating")
+    def average_rating_display(self, obj):
+        return f"{obj.average_rating:.1f}" if obj.average_rating is not None else "-"
+
+    @admin.display(description="Ratings", ordering="review_count")
+    def rating_count_display(self, obj):
+        return obj.rating_count
+
+    @admin.action(description="Approve and publish selected books")
     def approve_books(self, request, queryset):
         from core.notifications_utils import send_post_approved_notification
         from core.tasks import notify_indexnow
 
-        count = 0
-        for book in queryset.filter(is_approved=False):
-            book.is_approved = True
-            book.is_published = True
-            book.pending_approval = False
-            book.is_rejected = False
-            book.save(update_fields=["is_approved", "is_published", "pending_approval", "is_rejected"])
+        # Flip every flag in one UPDATE; the loaded rows are only needed for the notifications
+        books = list(queryset.filter(is_approved=False).select_related("added_by").only(*NOTIFICATION_FIELDS))
+        BookRecommendation.objects.filter(pk__in=[book.pk for book in books]).update(
+            is_approved=True, is_published=True, pending_approval=False, is_rejected=False
+        )
+        for book in books:
             send_post_approved_notification(book, post_type="book recommendation")
             if book.slug:
                 notify_indexnow(f"https://igboarchives.com.ng/books/{book.slug}/")
-            count += 1
-        self.message_user(request, f"{count} book(s) approved, published, and notifications sent.")
-
-    approve_books.short_description = "Approve and publish selected books"
+        self.message_user(request, f"{len(books)} book(s) approved, published, and notifications sent.")
 
+    @admin.action(description="Reject selected books")
     def reject_books(self, request, queryset):
         from core.notifications_utils import send_post_rejected_notification
 
-        count = 0
-        for book in queryset.filter(is_rejected=False):
-            book.is_approved = False
-            book.is_published = False
-            book.is_rejected = True
-            book.pending_approval = False
-            book.save(update_fields=["is_approved", "is_published", "is_rejected", "pending_approval"])
+        books = list(queryset.filter(is_rejected=False).select_related("added_by").only(*NOTIFICATION_FIELDS))
+        BookRecommendation.objects.filter(pk__in=[book.pk for book in books]).update(
+            is_approved=False, is_published=False, is_rejected=True, pending_approval=False
+        )
+        for book in books:
             send_post_rejected_notification(
                 book, reason=book.rejection_reason or "Did not meet guidelines", post_type="book recommendation"
             )
-            count += 1
-        self.message_user(request, f"{count} book(s) rejected and notifications sent.")
-
-    reject_books.short_description = "Reject selected books"
+        self.message_user(request, f"{len(books)} book(s) rejected and notifications sent.")
 
+    @admin.action(description="Publish selected books")
     def publish_books(self, request, queryset):
-        queryset.update(is_published=True)
-
-    publish_books.short_description = "Publish selected books"
+        count = queryset.update(is_published=True)
+        self.message_user(request, f"{count} book(s) published.")
 
+    @admin.action(description="Unpublish selected books")
     def unpublish_books(self, request, queryset):
-        queryset.update(is_published=False)
-
-    unpublish_books.short_description = "Unpublish selected books"
+        count = queryset.update(is_published=False)
+        self.message_user(request, f"{count} book(s) unpublished.")
 
+    @admin.action(description="📱 Post selected to Social Media (FB, IG, Mastodon)")
     def post_to_social_media(self, request, queryset):
         from core.tasks import post_to_social_media_task
 
@@ -114,67 +248,18 @@ class BookRecommendationAdmin(admin.ModelAdmin):
             count += 1
         self.message_user(request, f"{count} book(s) queued for social media posting.")
 
-    post_to_social_media.short_description = "📱 Post selected to Social Media (FB, IG, Mastodon)"
-
     def content_preview(self, obj):
-        """Render EditorJS content as HTML for admin preview with XSS protection."""
-        if not obj.content_json or not isinstance(obj.content_json, dict):
-            return "No content"
-
-        if nh3 is None:
-            from django.utils.html import strip_tags
-
-            blocks = obj.content_json.get("blocks", [])
-            text_parts = [strip_tags(b.get("data", {}).get("text", "")) for b in blocks[:5]]
-            return mark_safe(f"<p>{'</p><p>'.join(text_parts)}</p>") if text_parts else "No content"
-
-        blocks = obj.content_json.get("blocks", [])
-        if not blocks:
-            return "No content blocks"
-
-        html_parts = []
-        for block in blocks[:20]:
-            block_type = block.get("type", "paragraph")
-            data = block.get("data", {})
-
-            if block_type == "header":
-                level = min(max(int(data.get("level", 2)), 1), 6)
-                text = nh3.clean(data.get("text", ""), tags=ADMIN_PREVIEW_ALLOWED_TAGS)
-                html_parts.append(f'<h{level} style="margin:0.5em 0">{text}</h{level}>')
-            elif block_type == "paragraph":
-                text = nh3.clean(data.get("text", ""), tags=ADMIN_PREVIEW_ALLOWED_TAGS)
-                html_parts.append(f'<p style="margin:0.5em 0">{text}</p>')
-            elif block_type == "list":
-                style = data.get("style", "unordered")
-                tag = "ol" if style == "ordered" else "ul"
-                items = data.get("items", [])
-                items_html_parts = []
-                for item in items:
-                    # Handle nested list items (dicts with 'content' key)
-                    if isinstance(item, dict):
-                        text = item.get("content", "")
-                    elif isinstance(item, str):
-                        text = item
-                    else:
-                        continue
-                    items_html_parts.append(f"<li>{nh3.clean(text, tags=ADMIN_PREVIEW_ALLOWED_TAGS)}</li>")
-                items_html = "".join(items_html_parts)
-                html_parts.append(f'<{tag} style="margin:0.5em 0;padding-left:1.5em">{items_html}</{tag}>')
-            elif block_type == "quote":
-                text = nh3.clean(data.get("text", ""), tags=ADMIN_PREVIEW_ALLOWED_TAGS)
-                html_parts.append(
-                    f'<blockquote style="margin:1em 0;padding:0.5em 1em;border-left:3px solid #ddd;background:#f9f9f9">{text}</blockquote>'
-                )
-            elif block_type == "delimiter":
-                html_parts.append('<hr style="margin:1em 0">')
+        """Render EditorJS content as HTML for admin preview with XSS protection.
 
-        if len(blocks) > 20:
-            html_parts.append(f'<p style="color:#888"><em>... and {len(blocks) - 20} more blocks</em></p>')
+        The HTML is cached per save (keyed on updated_at), so reloading the change page
+        does not sanitize every block again.
+        """
+        if obj.pk is None or obj.updated_at is None:
+            return mark_safe(render_content_preview(obj.content_json))
 
-        content = "".join(html_parts)
-        return mark_safe(
-            f'<div style="max-width:700px;padding:1rem;background:#fafafa;border-radius:8px;border:1px solid #e0e0e0">{content}</div>'
-        )
+        cache_key = f"book_content_preview_{obj.pk}_{obj.updated_at.timestamp()}"
+        html = cache.get_or_set(cache_key, lambda: render_content_preview(obj.content_json), 3600)
+        return mark_safe(html)
 
     content_preview.short_description = "Content Preview"
 
@@ -182,9 +267,12 @@ class BookRecommendationAdmin(admin.ModelAdmin):
 @admin.register(UserBookRating)
 class UserBookRatingAdmin(admin.ModelAdmin):
     list_display = ["book", "user", "rating", "short_review", "created_at"]
+    list_select_related = ["book", "user"]
     list_filter = ["rating", "created_at"]
     search_fields = ["book__book_title", "user__username", "user__email", "review_text"]
     readonly_fields = ("created_at", "updated_at")
+    # Filtered and searched lists skip the extra unfiltered COUNT(*) behind "(N total)"
+    show_full_result_count = False
 
     def short_review(self, obj):
         return obj.review_text[:50] + "..." if obj.review_text else ""
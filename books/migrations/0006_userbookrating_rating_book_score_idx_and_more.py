@@ -0,0 +1,20 @@
+# Generated by Django 6.0.3 on 2026-10-16 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("books", "0005_alter_bookrecommendation_slug"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="userbookrating",
+            index=models.Index(fields=["book", "rating"], name="rating_book_score_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="userbookrating",
+            index=models.Index(fields=["book", "-created_at"], name="rating_book_recent_idx"),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.3 on 2026-10-16 13:00
+
+from django.db import migrations, models
+from django.db.models import Avg, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_rating_stats(apps, schema_editor):
+    BookRecommendation = apps.get_model("books", "BookRecommendation")
+    UserBookRating = apps.get_model("books", "UserBookRating")
+
+    ratings = UserBookRating.objects.filter(book=OuterRef("pk")).order_by().values("book")
+    BookRecommendation.objects.update(
+        avg_rating=Subquery(ratings.annotate(avg=Avg("rating")).values("avg")),
+        review_count=Coalesce(Subquery(ratings.annotate(total=Count("pk")).values("total")), 0),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("books", "0006_userbookrating_rating_book_score_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bookrecommendation",
+            name="avg_rating",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="bookrecommendation",
+            name="review_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
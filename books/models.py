@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
 from django.core.validators import FileExtensionValidator, MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import Avg, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.urls import reverse
 
 from core.validators import validate_image_size
@@ -53,6 +55,10 @@ class BookRecommendation(models.Model):
     rejection_reason = models.TextField(blank=True, help_text="Internal reason for rejection")
     submitted_at = models.DateTimeField(null=True, blank=True, help_text="When submitted for approval")
 
+    # Denormalized from UserBookRating by update_book_rating_stats(); None until the first rating
+    avg_rating = models.FloatField(null=True, blank=True, editable=False)
+    review_count = models.PositiveIntegerField(default=0, editable=False)
+
     class Meta:
         ordering = ["-created_at"]
         indexes = [
@@ -76,20 +82,13 @@ class BookRecommendation(models.Model):
 
     @property
     def average_rating(self):
-        """Return annotated avg_rating if available, else query DB."""
-        if hasattr(self, "avg_rating"):
-            return self.avg_rating
-        from django.db.models import Avg
-
-        result = self.ratings.aggregate(avg=Avg("rating"))
-        return result["avg"]
+        """Average user rating, kept on the row by the UserBookRating signals."""
+        return self.avg_rating
 
     @property
     def rating_count(self):
-        """Return annotated review_count if available, else query DB."""
-        if hasattr(self, "review_count"):
-            return self.review_count
-        return self.ratings.count()
+        """Number of user ratings, kept on the row by the UserBookRating signals."""
+        return self.review_count
 
 
 class UserBookRating(models.Model):
@@ -109,6 +108,11 @@ class UserBookRating(models.Model):
 
     class Meta:
         constraints = [models.UniqueConstraint(fields=["book", "user"], name="unique_user_book_rating")]
+        indexes = [
+            # rating sits in the index itself, so AVG/COUNT per book never touch the table
+            models.Index(fields=["book", "rating"], name="rating_book_score_idx"),
+            models.Index(fields=["book", "-created_at"], name="rating_book_recent_idx"),
+        ]
         ordering = ["-created_at"]
         verbose_name = "User Book Rating"
         verbose_name_plural = "User Book Ratings"
@@ -117,8 +121,17 @@ class UserBookRating(models.Model):
         return f"{self.user} rated {self.book.book_title}: {self.rating}/5"
 
 
+def update_book_rating_stats(book_id):
+    """Recompute a book's stored average and count from its ratings in a single UPDATE."""
+    ratings = UserBookRating.objects.filter(book=OuterRef("pk")).order_by().values("book")
+    BookRecommendation.objects.filter(pk=book_id).update(
+        avg_rating=Subquery(ratings.annotate(avg=Avg("rating")).values("avg")),
+        review_count=Coalesce(Subquery(ratings.annotate(total=Count("pk")).values("total")), 0),
+    )
+
+
 # --- Social Media Trigger ---
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 
@@ -128,3 +141,11 @@ def auto_post_book_to_social(sender, instance, created, **kwargs):
         from core.tasks import post_to_social_media_task
 
         post_to_social_media_task(app_label="books", model_name="BookRecommendation", object_id=instance.id)
+
+
+# --- Rating Stats ---
+@receiver(post_save, sender=UserBookRating)
+@receiver(post_delete, sender=UserBookRating)
+def refresh_book_rating_stats(sender, instance, **kwargs):
+    """New, edited and deleted ratings all move the book's stored average and count."""
+    update_book_rating_stats(instance.book_id)
@@ -13,7 +13,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ValidationError
 from django.core.paginator import Paginator
-from django.db.models import Avg, Count, Q
+from django.db.models import Q
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -46,13 +46,11 @@ def get_latest_books(book, count=9):
             "slug",
             "cover_image",
             "created_at",
+            "avg_rating",
+            "review_count",
             "added_by__full_name",
             "added_by__username",
         )
-        .annotate(
-            avg_rating=Avg("ratings__rating"),
-            review_count=Count("ratings"),
-        )
         .order_by("-created_at")
     )
 
@@ -73,13 +71,11 @@ def book_list(request):
             "author",
             "publication_year",
             "created_at",
+            "avg_rating",
+            "review_count",
             "added_by__full_name",
             "added_by__username",
         )
-        .annotate(
-            avg_rating=Avg("ratings__rating"),
-            review_count=Count("ratings"),
-        )
     )
 
     if search := request.GET.get("search"):
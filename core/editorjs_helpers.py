@@ -92,25 +92,20 @@ def generate_unique_slug(base_text, model_class, max_length=200, exclude_pk=None
         str: Unique slug
     """
     base_slug = slugify(base_text)[:max_length]
-    slug = base_slug
 
-    counter = 1
-    queryset = model_class.objects.filter(slug=slug)
+    # Probe every candidate in one indexed IN lookup instead of one query per collision
+    candidates = [base_slug, *(f"{base_slug}-{counter}" for counter in range(1, 100))]
+    queryset = model_class.objects.filter(slug__in=candidates)
     if exclude_pk:
         queryset = queryset.exclude(pk=exclude_pk)
+    taken = set(queryset.values_list("slug", flat=True))
 
-    while queryset.exists():
-        slug = f"{base_slug}-{counter}"
-        queryset = model_class.objects.filter(slug=slug)
-        if exclude_pk:
-            queryset = queryset.exclude(pk=exclude_pk)
-        counter += 1
-        if counter > 100:
-            # Fallback to UUID if too many collisions
-            slug = f"{base_slug}-{uuid.uuid4().hex[:8]}"
-            break
-
-    return slug
+    for slug in candidates:
+        if slug not in taken:
+            return slug
+
+    # Fallback to UUID if too many collisions
+    return f"{base_slug}-{uuid.uuid4().hex[:8]}"
 
 
 def get_workflow_flags(action, is_submit=False):
@@ -19,6 +19,7 @@ Usage:
 import logging
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.mail import send_mail
 from django.utils import timezone
 
@@ -28,6 +29,9 @@ logger = logging.getLogger(__name__)
 DAILY_EMAIL_LIMIT = 300
 DIGEST_BATCH_LIMIT = 290  # Leave 10 for instant/admin emails
 
+ADMIN_EMAILS_CACHE_KEY = "staff_emails"
+ADMIN_EMAILS_CACHE_TIMEOUT = 600
+
 
 def get_quota_status():
     """Get current email quota status."""
@@ -105,17 +109,26 @@ def send_email(to_email, subject, message, email_type="instant", html_message=No
         return False
 
 
+def get_admin_emails():
+    """Active staff addresses, cached; users.models clears the cache when a user changes."""
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    return cache.get_or_set(
+        ADMIN_EMAILS_CACHE_KEY,
+        lambda: list(
+            User.objects.filter(is_staff=True, is_active=True).exclude(email="").values_list("email", flat=True)
+        ),
+        ADMIN_EMAILS_CACHE_TIMEOUT,
+    )
+
+
 def send_admin_notification(subject, message, html_message=None):
     """
     Send notification to all admin users.
     Uses 'admin' email type which bypasses quota checks.
     """
-    from django.contrib.auth import get_user_model
-
-    User = get_user_model()
-    admin_emails = list(
-        User.objects.filter(is_staff=True, is_active=True).exclude(email="").values_list("email", flat=True)
-    )
+    admin_emails = get_admin_emails()
 
     if not admin_emails:
         logger.warning("No admin emails found for notification")
@@ -87,7 +87,8 @@ class Command(BaseCommand):
                 return
 
             self.stdout.write(self.style.WARNING(f"[{timestamp}] Starting database backup to R2..."))
-            call_command("dbbackup", clean=options["clean"])
+            # Gzip before upload; SQLite pages compress well, so far fewer bytes cross the network
+            call_command("dbbackup", clean=options["clean"], compress=True)
             self.stdout.write(self.style.SUCCESS(f"[{timestamp}] Database backup completed successfully!"))
 
             self.stdout.write(self.style.SUCCESS("\n=== Backup Summary ==="))
@@ -260,8 +260,9 @@ def send_note_approved_notification(note):
 
 def send_admin_notification(subject, description, target_url=None):
     """
-    Notify site administrators. Delegates to email_service.send_admin_notification
-    for quota-tracked email sending. Appends target_url to message if provided.
+    Notify site administrators. Queues email_service.send_admin_notification on Huey
+    so the staff lookup and per-admin sends stay off the request. Appends target_url
+    to message if provided.
     """
     message = description
     if target_url:
@@ -269,11 +270,11 @@ def send_admin_notification(subject, description, target_url=None):
         message += f"\n\nReview link: {site_url}{target_url}"
 
     try:
-        from core.email_service import send_admin_notification as _send_admin_email
+        from core.tasks import send_admin_notification_task
 
-        _send_admin_email(subject, message)
+        send_admin_notification_task(subject, message)
     except Exception as e:
-        logger.error(f"Failed to send admin notification: {e}")
+        logger.error(f"Failed to queue admin notification: {e}")
 
 
 def send_comment_reply_notification(comment, parent_comment):
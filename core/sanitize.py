@@ -0,0 +1,7 @@
+"""
+Shared helpers for nh3 HTML sanitization.
+"""
+
+# Text without any of these comes back from the cleaner unchanged: no markup, nothing to
+# entity-escape (& < > NBSP) and nothing the HTML parser normalizes (CR, NUL)
+SANITIZER_TRIGGER_CHARS = frozenset("<>&\u00a0\r\0")
@@ -39,6 +39,14 @@ def send_email_async(subject, message, recipient_list, from_email=None):
         return False
 
 
+@db_task()
+def send_admin_notification_task(subject, message):
+    """Email every staff member in the worker rather than the submitting request"""
+    from core.email_service import send_admin_notification
+
+    return send_admin_notification(subject, message)
+
+
 @db_task()
 def send_push_notification_async(user_id, title, body, url=None):
     """Send push notification asynchronously"""
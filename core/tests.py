@@ -28,35 +28,6 @@ class HomePageTests(TestCase):
         response = self.client.get("/", follow=True)
         self.assertEqual(response.status_code, 200)
 
-    def test_homepage_shows_approved_archives(self):
-        """Test that only approved archives are fetched for homepage."""
-        from django.core.cache import cache
-
-        from core.views import get_all_approved_archive_ids
-
-        cache.clear()
-
-        approved = Archive.objects.create(
-            title="Approved Archive",
-            description="Test description",
-            archive_type="image",
-            uploaded_by=self.user,
-            is_approved=True,
-        )
-        unapproved = Archive.objects.create(
-            title="Unapproved Archive",
-            description="Test description",
-            archive_type="image",
-            uploaded_by=self.user,
-            is_approved=False,
-        )
-
-        # Test the helper function directly
-        approved_ids = get_all_approved_archive_ids()
-
-        self.assertIn(approved.id, approved_ids)
-        self.assertNotIn(unapproved.id, approved_ids)
-
 
 class StaticPageTests(TestCase):
     """Tests for static informational pages."""
@@ -181,6 +152,18 @@ class ValidatorsTests(TestCase):
         result = get_safe_sort("invalid_sort; DROP TABLE;", ALLOWED_ARCHIVE_SORTS)
         self.assertEqual(result, "-created_at")
 
+    def test_generate_unique_slug_probes_collisions_in_one_query(self):
+        """Test that taken slugs get the first free numeric suffix from a single lookup."""
+        from core.editorjs_helpers import generate_unique_slug
+
+        user = User.objects.create_user(username="sluguser", password="password")
+        first = Archive.objects.create(title="Ofo Staff", archive_type="image", uploaded_by=user)
+        Archive.objects.create(title="Ofo Staff", archive_type="image", uploaded_by=user)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(generate_unique_slug("Ofo Staff", Archive), "ofo-staff-2")
+        self.assertEqual(generate_unique_slug("Ofo Staff", Archive, exclude_pk=first.pk), "ofo-staff")
+
 
 class MediaCleanupTests(TestCase):
     """Tests for automatic media deletion using django-cleanup."""
@@ -304,6 +287,30 @@ class BackgroundTaskTests(TestCase):
         self.assertTrue(result)
         mock_send_push.assert_called_once()
 
+    @patch("core.email_service.send_email")
+    def test_send_admin_notification_task_uses_cached_staff_emails(self, mock_send_email):
+        """Staff recipients are cached and refreshed when a staff account changes."""
+        from django.core.cache import cache
+
+        from core.email_service import ADMIN_EMAILS_CACHE_KEY
+        from core.tasks import send_admin_notification_task
+
+        cache.delete(ADMIN_EMAILS_CACHE_KEY)
+        staff = User.objects.create_user(username="staffer", email="staff@example.com", password="p", is_staff=True)
+
+        self.assertTrue(send_admin_notification_task.func("Subject", "Body"))
+        self.assertEqual(cache.get(ADMIN_EMAILS_CACHE_KEY), ["staff@example.com"])
+
+        staff.last_login = staff.date_joined
+        staff.save(update_fields=["last_login"])
+        self.assertEqual(cache.get(ADMIN_EMAILS_CACHE_KEY), ["staff@example.com"])
+
+        staff.is_staff = False
+        staff.save(update_fields=["is_staff"])
+        self.assertIsNone(cache.get(ADMIN_EMAILS_CACHE_KEY))
+        self.assertFalse(send_admin_notification_task.func("Subject", "Body"))
+        mock_send_email.assert_called_once()
+
 
 class SocialMediaTaskTests(TestCase):
     """Tests for social media auto-posting."""
@@ -6,7 +6,7 @@ from django.core.exceptions import ValidationError
 
 
 def validate_file_size(file, max_mb):
-    """Validate file size against maximum MB limit."""
+    """Validate file size against maximum MB limit using the upload's size metadata (never reads the file)."""
     if file.size > max_mb * 1024 * 1024:
         raise ValidationError(f"Maximum file size is {max_mb}MB")
 
@@ -50,7 +50,7 @@ ALLOWED_BOOK_SORTS = {
     "recently-added": "-created_at",
     "newest": "-publication_year",
     "oldest": "publication_year",
-    "top-rated": "-rating",
+    "top-rated": "-avg_rating",
 }
 
 
@@ -13,23 +13,6 @@ from archives.models import Archive
 logger = logging.getLogger(__name__)
 
 
-def get_all_approved_archive_ids():
-    """Cache all approved archive IDs. For datasets under 100k, this is memory-efficient.
-
-    Memory estimate: 100,000 IDs * 8 bytes = ~800KB, well within 1GB constraint.
-    """
-    cache_key = "all_approved_archive_ids"
-    archive_ids = cache.get(cache_key)
-
-    if archive_ids is None:
-        archive_ids = tuple(
-            Archive.objects.filter(is_approved=True).values_list("id", flat=True).iterator(chunk_size=1000)
-        )
-        cache.set(cache_key, archive_ids, 300)
-
-    return archive_ids
-
-
 def get_random_featured_archives(max_count=50):
     """Memory-efficient random archive selection for homepage carousel.
 
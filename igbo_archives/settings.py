@@ -191,6 +191,8 @@ if DEBUG:
         },
     }
 else:
+    from boto3.s3.transfer import TransferConfig
+
     if R2_CUSTOM_DOMAIN:
         MEDIA_URL = f"https://{R2_CUSTOM_DOMAIN}/"
 
@@ -222,6 +224,13 @@ else:
                 "location": "backups",
                 "addressing_style": "path",
                 "signature_version": "s3v4",
+                # Parallel multipart upload; 4 x 16MB parts in flight keeps memory bounded on the 1GB VM
+                "transfer_config": TransferConfig(
+                    multipart_threshold=8 * 1024 * 1024,
+                    multipart_chunksize=16 * 1024 * 1024,
+                    max_concurrency=4,
+                    use_threads=True,
+                ),
             },
         },
     }
@@ -273,9 +282,10 @@ SOCIALACCOUNT_EMAIL_AUTHENTICATION_AUTO_CONNECT = True
 
 # --- Upload Limits ---
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB — safe for 1GB RAM VM
-FILE_UPLOAD_MAX_MEMORY_SIZE = 52428800  # 50MB — actual files go to disk via TemporaryFileUploadHandler
+FILE_UPLOAD_MAX_MEMORY_SIZE = 2621440  # 2.5MB — larger uploads fall through to TemporaryFileUploadHandler
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 1000
 FILE_UPLOAD_HANDLERS = [
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
     "django.core.files.uploadhandler.TemporaryFileUploadHandler",
 ]
 
@@ -366,7 +376,9 @@ META_DEFAULT_IMAGE = "/static/images/logos/og-image.png"
 DBBACKUP_CLEANUP_KEEP = 3
 DBBACKUP_DATE_FORMAT = "%Y-%m-%d-%H-%M-%S"
 DBBACKUP_FILENAME_TEMPLATE = "igbo-archives-{databasename}-{datetime}.{extension}"
-DBBACKUP_CONNECTORS = {"default": {"CONNECTOR": "dbbackup.db.sqlite.SqliteConnector"}}
+# Page-level copy through sqlite3's online backup API: consistent while the app writes,
+# and far cheaper than SqliteConnector's SQL text dump of every row
+DBBACKUP_CONNECTORS = {"default": {"CONNECTOR": "dbbackup.db.sqlite.SqliteBackupConnector"}}
 
 # --- Tasks / Background Limits (Huey) ---
 DJANGO_HUEY = {
@@ -0,0 +1,13 @@
+"""
+Django settings for running the Igbo Archives test suite.
+
+Usage: python manage.py test --settings=igbo_archives.settings_test
+"""
+
+from .settings import *  # noqa: F403
+
+# In-memory DB built straight from models (no migration replay); migration data steps are tested directly
+DATABASES["default"]["TEST"] = {"NAME": ":memory:", "MIGRATE": False}  # noqa: F405
+
+# Cheap hashing for fixture users
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
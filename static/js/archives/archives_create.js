@@ -67,7 +67,7 @@ function setupAutocomplete(inputId, datalistId, fieldName) {
 
     input.addEventListener('input', function () {
         const query = this.value;
-        if (query.length < 2) return;
+        if (query.length < 3) return;
 
         fetch(`/archives/suggestions/?q=${encodeURIComponent(query)}&field=${fieldName}`)
             .then(response => response.json())
@@ -2,9 +2,13 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse
 
+from core.email_service import ADMIN_EMAILS_CACHE_KEY
 from core.validators import validate_image_size
 
 
@@ -97,3 +101,21 @@ class Notification(models.Model):
         if self.unread:
             self.unread = False
             self.save(update_fields=["unread"])
+
+
+# --- Cache Invalidation ---
+STAFF_EMAIL_FIELDS = frozenset({"email", "is_active", "is_staff"})
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_staff_emails(sender, instance, update_fields=None, **kwargs):
+    """Keep the cached admin-notification recipients in step with staff accounts.
+
+    Partial saves that leave email, is_active and is_staff alone (last_login on every
+    sign-in, profile edits) cannot change the list and are skipped.
+    """
+    if update_fields is not None and STAFF_EMAIL_FIELDS.isdisjoint(update_fields):
+        return
+
+    cache.delete(ADMIN_EMAILS_CACHE_KEY)